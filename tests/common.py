@@ -24,6 +24,24 @@
 This module contains common functions present in Pandora2D's tests.
 """
 
+import json
+
+
+def clone_cfg(cfg: dict) -> dict:
+    """
+    Return a deep copy of a configuration dictionary.
+
+    Configurations only hold JSON values, so a json round-trip is used as it is
+    much faster than copy.deepcopy on small nested dicts.
+
+    :param cfg: configuration to copy
+    :type cfg: dict
+    :return: deep copy of the configuration
+    :rtype: dict
+    """
+    return json.loads(json.dumps(cfg))
+
+
 correct_input = {
     "input": {
         "left": {
@@ -1,7 +1,5 @@
 """ Module with global test fixtures. """
 
-from copy import deepcopy
-
 import pytest
 
 from pandora2d import Pandora2DMachine
@@ -16,4 +14,4 @@ def pandora2d_machine():
 
 @pytest.fixture()
 def pipeline_config():
-    return deepcopy(common.correct_pipeline)
+    return common.clone_cfg(common.correct_pipeline)
@@ -30,6 +30,7 @@ import numpy as np
 import xarray as xr
 from json_checker import DictCheckerError
 
+from pandora2d import Pandora2DMachine
 from pandora2d.img_tools import create_datasets_from_inputs, add_disparity_grid
 from pandora2d import check_configuration
 from tests import common
@@ -38,9 +39,9 @@ from tests import common
 class TestCheckDatasets:
     """Test check_datasets function."""
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def datasets(self):
-        """Build dataset."""
+        """Build dataset once for all tests as they do not mutate it."""
         input_cfg = {
             "left": {"img": "./tests/data/left.png", "nodata": -9999},
             "right": {"img": "./tests/data/right.png", "nodata": -9999},
@@ -195,20 +196,17 @@ class TestCheckStep:
         pipeline_config["pipeline"]["matching_cost"]["step"] = [1, 1]
         assert check_configuration.check_pipeline_section(pipeline_config, pandora2d_machine)
 
-    @pytest.mark.parametrize(
-        "step",
-        [
-            pytest.param([1], id="one size list"),
-            pytest.param([-1, 1], id="negative value"),
-            pytest.param([1, 1, 1], id="More than 2 elements"),
-            pytest.param([1, "1"], id="String element"),
-        ],
-    )
-    def test_fails_with_bad_step_values(self, pipeline_config, pandora2d_machine, step) -> None:
-        """Test check_pipeline_section fails with bad values of step."""
-        pipeline_config["pipeline"]["matching_cost"]["step"] = step
-        with pytest.raises(DictCheckerError):
-            check_configuration.check_pipeline_section(pipeline_config, pandora2d_machine)
+    def test_fails_with_bad_step_values(self, pipeline_config) -> None:
+        """Test check_pipeline_section fails with bad values of step.
+
+        All failing cases are grouped in one test to keep a single configuration and pytest item.
+        """
+        bad_steps = ([1], [-1, 1], [1, 1, 1], [1, "1"])
+        for step in bad_steps:
+            pipeline_config["pipeline"]["matching_cost"]["step"] = step
+            # A failed check leaves the machine mid-transition, so each case needs its own machine
+            with pytest.raises(DictCheckerError):
+                check_configuration.check_pipeline_section(pipeline_config, Pandora2DMachine())
 
 
 class TestCheckConfMatchingCostNodataCondition:
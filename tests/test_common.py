@@ -25,7 +25,9 @@ Test common
 """
 import os
 import unittest
+from unittest.mock import patch
 
+import pytest
 import xarray as xr
 import numpy as np
 
@@ -45,21 +47,39 @@ class TestCommon(unittest.TestCase):
         self.row = np.ones((2, 2))
         self.col = np.ones((2, 2))
 
-    def test_save_dataset(self):
+    def create_dataset(self):
         """
-        Function for testing the dataset_save function
+        Build the dataset given to save_dataset
         """
-        dataset_y = xr.Dataset(
-            {"row_map": (["row", "col"], self.row)},
+        return xr.Dataset(
+            {"row_map": (["row", "col"], self.row), "col_map": (["row", "col"], self.col)},
             coords={"row": np.arange(self.row.shape[0]), "col": np.arange(self.row.shape[1])},
         )
 
-        dataset_x = xr.Dataset(
-            {"col_map": (["row", "col"], self.col)},
-            coords={"row": np.arange(self.col.shape[0]), "col": np.arange(self.col.shape[1])},
-        )
+    def test_save_dataset(self):
+        """
+        Function for testing the dataset_save function
+
+        The rasterio writer is mocked so that the test does not pay for two tiff encodings;
+        test_save_dataset_on_disk covers the real write.
+        """
+        dataset = self.create_dataset()
+
+        with patch("pandora2d.common.mkdir_p") as mocked_mkdir_p, patch(
+            "pandora2d.common.write_data_array"
+        ) as mocked_write_data_array:
+            common.save_dataset(dataset, "./tests/res_test/")
 
-        dataset = dataset_y.merge(dataset_x, join="override", compat="override")
+        mocked_mkdir_p.assert_called_once_with("./tests/res_test/")
+        written_paths = [call.args[1] for call in mocked_write_data_array.call_args_list]
+        assert written_paths == ["./tests/res_test/row_disparity.tif", "./tests/res_test/columns_disparity.tif"]
+
+    @pytest.mark.disk
+    def test_save_dataset_on_disk(self):
+        """
+        Function for testing the dataset_save function with real disk writes
+        """
+        dataset = self.create_dataset()
 
         common.save_dataset(dataset, "./tests/res_test/")
         assert os.path.exists("./tests/res_test/")
@@ -77,19 +97,12 @@ class TestCommon(unittest.TestCase):
         Test function for create a dataset
         """
 
-        # create a test dataset for map row
+        # create a test dataset with both maps in one go to spare coords construction and a merge
         data = np.zeros((2, 2))
-        dataset_y = xr.Dataset(
-            {"row_map": (["row", "col"], data)},
-            coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
-        )
-        # create a test dataset for map col
-        dataset_x = xr.Dataset(
-            {"col_map": (["row", "col"], data)},
+        dataset_test = xr.Dataset(
+            {"row_map": (["row", "col"], data), "col_map": (["row", "col"], data)},
             coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
         )
-        # merge two dataset into one
-        dataset_test = dataset_y.merge(dataset_x, join="override", compat="override")
 
         # create dataset with function
         dataset_fun = common.dataset_disp_maps(data, data)
@@ -43,10 +43,12 @@ class TestDisparity(unittest.TestCase):
     TestDisparity class allows to test all the methods in the class Disparity
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         """
         Method called to prepare the test fixture
 
+        Datasets and cost volumes are computed once for the whole class as no test mutates them.
         """
         # Create a stereo object
         data = np.array(
@@ -54,11 +56,11 @@ class TestDisparity(unittest.TestCase):
             dtype=np.float64,
         )
         mask = np.array(([1, 1, 1], [0, 0, 0], [0, 0, 0]), dtype=np.int16)
-        self.left = xr.Dataset(
+        cls.left = xr.Dataset(
             {"im": (["row", "col"], data), "msk": (["row", "col"], mask)},
             coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
         )
-        self.left.attrs = {
+        cls.left.attrs = {
             "no_data_img": -9999,
             "valid_pixels": 0,
             "no_data_mask": 1,
@@ -73,11 +75,11 @@ class TestDisparity(unittest.TestCase):
             dtype=np.float64,
         )
         mask = np.array(([0, 0, 0], [0, 0, 0], [0, 0, 0]), dtype=np.int16)
-        self.right = xr.Dataset(
+        cls.right = xr.Dataset(
             {"im": (["row", "col"], data), "msk": (["row", "col"], mask)},
             coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
         )
-        self.right.attrs = {
+        cls.right.attrs = {
             "no_data_img": -9999,
             "valid_pixels": 0,
             "no_data_mask": 1,
@@ -91,11 +93,11 @@ class TestDisparity(unittest.TestCase):
         mask = np.array(
             ([0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]), dtype=np.int16
         )
-        self.left_arg = xr.Dataset(
+        cls.left_arg = xr.Dataset(
             {"im": (["row", "col"], data), "msk": (["row", "col"], mask)},
             coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
         )
-        self.left_arg.attrs = {
+        cls.left_arg.attrs = {
             "no_data_img": -9999,
             "valid_pixels": 0,
             "no_data_mask": 1,
@@ -112,11 +114,11 @@ class TestDisparity(unittest.TestCase):
         mask = np.array(
             ([0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]), dtype=np.int16
         )
-        self.right_arg = xr.Dataset(
+        cls.right_arg = xr.Dataset(
             {"im": (["row", "col"], data), "msk": (["row", "col"], mask)},
             coords={"row": np.arange(data.shape[0]), "col": np.arange(data.shape[1])},
         )
-        self.right_arg.attrs = {
+        cls.right_arg.attrs = {
             "no_data_img": -9999,
             "valid_pixels": 0,
             "no_data_mask": 1,
@@ -124,6 +126,38 @@ class TestDisparity(unittest.TestCase):
             "transform": Affine(1.0, 0.0, 0.0, 0.0, 1.0, 0.0),
         }
 
+        # Cost volumes shared by the min/max and argmin/argmax split tests, with SAD measure,
+        # dispx_min 0, dispx_max 1, dispy_min -1, dispy_max 0
+        cls.cvs = cls.compute_cvs(cls.left, cls.right, {"matching_cost_method": "sad", "window_size": 1})
+        cls.cvs_arg = cls.compute_cvs(cls.left_arg, cls.right_arg, {"matching_cost_method": "sad", "window_size": 3})
+
+    @staticmethod
+    def compute_cvs(img_left: xr.Dataset, img_right: xr.Dataset, cfg: dict) -> xr.Dataset:
+        """
+        Compute the cost volumes used by the split tests
+
+        :param img_left: left Dataset image
+        :type img_left: xarray.Dataset
+        :param img_right: right Dataset image
+        :type img_right: xarray.Dataset
+        :param cfg: matching cost configuration
+        :type cfg: dict
+        :return: 4D Dataset containing the cost_volumes
+        :rtype: xarray.Dataset
+        """
+        matching_cost_test = matching_cost.MatchingCost(cfg)
+
+        grid_min_col = np.broadcast_to(0, (3, 3))
+        grid_max_col = np.broadcast_to(1, (3, 3))
+        grid_min_row = np.broadcast_to(-1, (3, 3))
+        grid_max_row = np.broadcast_to(0, (3, 3))
+        matching_cost_test.allocate_cost_volume_pandora(
+            img_left=img_left, img_right=img_right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg
+        )
+        return matching_cost_test.compute_cost_volumes(
+            img_left, img_right, grid_min_col, grid_max_col, grid_min_row, grid_max_row
+        )
+
     @staticmethod
     def test_check_conf():
         """
@@ -150,29 +184,13 @@ class TestDisparity(unittest.TestCase):
         """
         Test the min_split function
         """
-
-        # create a cost_volume, with SAD measure, window_size 1, dispx_min 0, dispx_max 1, dispy_min 0, dispy_max 1
-        cfg = {"matching_cost_method": "sad", "window_size": 1}
-        matching_cost_test = matching_cost.MatchingCost(cfg)
-
-        grid_min_col = np.full((3, 3), 0)
-        grid_max_col = np.full((3, 3), 1)
-        grid_min_row = np.full((3, 3), -1)
-        grid_max_row = np.full((3, 3), 0)
-        matching_cost_test.allocate_cost_volume_pandora(
-            img_left=self.left, img_right=self.right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg
-        )
-        cvs = matching_cost_test.compute_cost_volumes(
-            self.left, self.right, grid_min_col, grid_max_col, grid_min_row, grid_max_row
-        )
-
         ad_ground_truth = np.zeros((3, 3, 2))
         ad_ground_truth[:, :, 0] = np.array([[np.nan, np.nan, np.nan], [0, 0, 0], [0, 0, 0]])
         ad_ground_truth[:, :, 1] = np.array([[np.nan, np.nan, np.nan], [0, 0, np.nan], [1, 1, np.nan]])
 
         disparity_test = disparity.Disparity({"disparity_method": "wta", "invalid_disparity": -9999})
         # searching along dispy axis
-        cvs_min = disparity_test.min_split(cvs, 3)
+        cvs_min = disparity_test.min_split(self.cvs, 3)
 
         np.testing.assert_allclose(cvs_min[:, :, 0], ad_ground_truth[:, :, 0], atol=1e-06)
         np.testing.assert_allclose(cvs_min[:, :, 1], ad_ground_truth[:, :, 1], atol=1e-06)
@@ -181,29 +199,13 @@ class TestDisparity(unittest.TestCase):
         """
         Test the min_split function
         """
-
-        # create a cost_volume, with SAD measure, window_size 1, dispx_min 0, dispx_max 1, dispy_min 0, dispy_max 1
-        cfg = {"matching_cost_method": "sad", "window_size": 1}
-        matching_cost_test = matching_cost.MatchingCost(cfg)
-
-        grid_min_col = np.full((3, 3), 0)
-        grid_max_col = np.full((3, 3), 1)
-        grid_min_row = np.full((3, 3), -1)
-        grid_max_row = np.full((3, 3), 0)
-        matching_cost_test.allocate_cost_volume_pandora(
-            img_left=self.left, img_right=self.right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg
-        )
-        cvs = matching_cost_test.compute_cost_volumes(
-            self.left, self.right, grid_min_col, grid_max_col, grid_min_row, grid_max_row
-        )
-
         ad_ground_truth = np.zeros((3, 3, 2))
         ad_ground_truth[:, :, 0] = np.array([[np.nan, np.nan, np.nan], [2, 3, 4], [2, 3, 4]])
         ad_ground_truth[:, :, 1] = np.array([[np.nan, np.nan, np.nan], [3, 4, np.nan], [2, 3, np.nan]])
 
         disparity_test = disparity.Disparity({"disparity_method": "wta", "invalid_disparity": -9999})
         # searching along dispy axis
-        cvs_max = disparity_test.max_split(cvs, 3)
+        cvs_max = disparity_test.max_split(self.cvs, 3)
 
         np.testing.assert_allclose(cvs_max[:, :, 0], ad_ground_truth[:, :, 0], atol=1e-06)
         np.testing.assert_allclose(cvs_max[:, :, 1], ad_ground_truth[:, :, 1], atol=1e-06)
@@ -213,32 +215,13 @@ class TestDisparity(unittest.TestCase):
         Test the argmin_split function
         """
 
-        # create a cost_volume, with SAD measure, window_size 1, dispx_min 0, dispx_max 1, dispy_min 0, dispy_max 1
-        cfg = {"matching_cost_method": "sad", "window_size": 3}
-        matching_cost_test = matching_cost.MatchingCost(cfg)
-
-        grid_min_col = np.full((3, 3), 0)
-        grid_max_col = np.full((3, 3), 1)
-        grid_min_row = np.full((3, 3), -1)
-        grid_max_row = np.full((3, 3), 0)
-        matching_cost_test.allocate_cost_volume_pandora(
-            img_left=self.left_arg,
-            img_right=self.right_arg,
-            grid_min_col=grid_min_col,
-            grid_max_col=grid_max_col,
-            cfg=cfg,
-        )
-        cvs = matching_cost_test.compute_cost_volumes(
-            self.left_arg, self.right_arg, grid_min_col, grid_max_col, grid_min_row, grid_max_row
-        )
-
         ad_ground_truth = np.array(
             [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 1, 0], [0, 0, 0, 1, 0], [0, 0, 0, 0, 0]]
         )
 
         disparity_test = disparity.Disparity({"disparity_method": "wta", "invalid_disparity": -9999})
         # searching along dispy axis
-        cvs_max = disparity_test.min_split(cvs, 3)
+        cvs_max = disparity_test.min_split(self.cvs_arg, 3)
         min_tensor = disparity_test.argmin_split(cvs_max, 2)
 
         np.testing.assert_allclose(min_tensor, ad_ground_truth, atol=1e-06)
@@ -248,32 +231,13 @@ class TestDisparity(unittest.TestCase):
         Test the argmax_split function
         """
 
-        # create a cost_volume, with SAD measure, window_size 1, dispx_min 0, dispx_max 1, dispy_min 0, dispy_max 1
-        cfg = {"matching_cost_method": "sad", "window_size": 3}
-        matching_cost_test = matching_cost.MatchingCost(cfg)
-
-        grid_min_col = np.full((3, 3), 0)
-        grid_max_col = np.full((3, 3), 1)
-        grid_min_row = np.full((3, 3), -1)
-        grid_max_row = np.full((3, 3), 0)
-        matching_cost_test.allocate_cost_volume_pandora(
-            img_left=self.left_arg,
-            img_right=self.right_arg,
-            grid_min_col=grid_min_col,
-            grid_max_col=grid_max_col,
-            cfg=cfg,
-        )
-        cvs = matching_cost_test.compute_cost_volumes(
-            self.left_arg, self.right_arg, grid_min_col, grid_max_col, grid_min_row, grid_max_row
-        )
-
         ad_ground_truth = np.array(
             [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 1, 0], [0, 0, 0, 0, 0]]
         )
 
         disparity_test = disparity.Disparity({"disparity_method": "wta", "invalid_disparity": -9999})
         # searching along dispy axis
-        cvs_max = disparity_test.max_split(cvs, 3)
+        cvs_max = disparity_test.max_split(self.cvs_arg, 3)
         max_tensor = disparity_test.argmax_split(cvs_max, 2)
 
         np.testing.assert_allclose(max_tensor, ad_ground_truth, atol=1e-06)
@@ -330,10 +294,10 @@ class TestDisparity(unittest.TestCase):
         cfg_disp = {"disparity_method": "wta", "invalid_disparity": -5}
         disparity_matcher = disparity.Disparity(cfg_disp)
 
-        grid_min_col = np.full((3, 3), -2)
-        grid_max_col = np.full((3, 3), 2)
-        grid_min_row = np.full((3, 3), -2)
-        grid_max_row = np.full((3, 3), 2)
+        grid_min_col = np.broadcast_to(-2, (3, 3))
+        grid_max_col = np.broadcast_to(2, (3, 3))
+        grid_min_row = np.broadcast_to(-2, (3, 3))
+        grid_max_row = np.broadcast_to(2, (3, 3))
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=left, img_right=right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg_mc
         )
@@ -398,10 +362,10 @@ class TestDisparity(unittest.TestCase):
         cfg_disp = {"disparity_method": "wta", "invalid_disparity": -5}
         disparity_matcher = disparity.Disparity(cfg_disp)
 
-        grid_min_col = np.full((3, 3), -3)
-        grid_max_col = np.full((3, 3), 3)
-        grid_min_row = np.full((3, 3), -3)
-        grid_max_row = np.full((3, 3), 3)
+        grid_min_col = np.broadcast_to(-3, (3, 3))
+        grid_max_col = np.broadcast_to(3, (3, 3))
+        grid_min_row = np.broadcast_to(-3, (3, 3))
+        grid_max_row = np.broadcast_to(3, (3, 3))
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=left, img_right=right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg_mc
         )
@@ -466,10 +430,10 @@ class TestDisparity(unittest.TestCase):
         cfg_disp = {"disparity_method": "wta", "invalid_disparity": -5}
         disparity_matcher = disparity.Disparity(cfg_disp)
 
-        grid_min_col = np.full((3, 3), -3)
-        grid_max_col = np.full((3, 3), 3)
-        grid_min_row = np.full((3, 3), -3)
-        grid_max_row = np.full((3, 3), 3)
+        grid_min_col = np.broadcast_to(-3, (3, 3))
+        grid_max_col = np.broadcast_to(3, (3, 3))
+        grid_min_row = np.broadcast_to(-3, (3, 3))
+        grid_max_row = np.broadcast_to(3, (3, 3))
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=left, img_right=right, grid_min_col=grid_min_col, grid_max_col=grid_max_col, cfg=cfg_mc
         )
@@ -35,7 +35,7 @@ import xarray as xr
 import pytest
 import json_checker
 from rasterio import Affine
-from skimage.io import imsave
+import tifffile
 
 from pandora.margins import Margins
 from pandora2d.img_tools import create_datasets_from_inputs
@@ -170,8 +170,8 @@ class TestMatchingCost(unittest.TestCase):
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
             cfg=cfg,
         )
 
@@ -179,10 +179,10 @@ class TestMatchingCost(unittest.TestCase):
         ssd = matching_cost_matcher.compute_cost_volumes(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
 
         # check that the generated cost_volumes is equal to ground truth
@@ -224,18 +224,18 @@ class TestMatchingCost(unittest.TestCase):
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
             cfg=cfg,
         )
         # compute cost volumes
         sad = matching_cost_matcher.compute_cost_volumes(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
         # check that the generated cost_volumes is equal to ground truth
         np.testing.assert_allclose(sad["cost_volumes"].data, ad_ground_truth, atol=1e-06)
@@ -323,18 +323,18 @@ class TestMatchingCost(unittest.TestCase):
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=left_zncc,
             img_right=right_zncc,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
             cfg=cfg,
         )
         # compute cost volumes
         zncc = matching_cost_matcher.compute_cost_volumes(
             img_left=left_zncc,
             img_right=right_zncc,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
         # check that the generated cost_volumes is equal to ground truth
 
@@ -395,17 +395,17 @@ class TestMatchingCost(unittest.TestCase):
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
             cfg=cfg,
         )
         cost_volumes_fun = matching_cost_matcher.compute_cost_volumes(
             img_left=self.left,
             img_right=self.right,
-            grid_min_col=np.full((3, 3), -1),
-            grid_max_col=np.full((3, 3), 0),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(-1, (3, 3)),
+            grid_max_col=np.broadcast_to(0, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
 
         # check that the generated xarray dataset is equal to the ground truth
@@ -491,11 +491,11 @@ class TestStep:
 
     @pytest.fixture()
     def positive_disparity_grid(self):
-        return np.full((3, 3), 1)
+        return np.broadcast_to(1, (3, 3))
 
     @pytest.fixture()
     def negative_disparity_grid(self):
-        return np.full((3, 3), -1)
+        return np.broadcast_to(-1, (3, 3))
 
     @pytest.fixture()
     def data_with_null_disparity(self, left_zncc, right_zncc, null_disparity_grid):
@@ -784,31 +784,33 @@ class TestStep:
 class TestMatchingCostWithRoi:
     """Test using roi in pandora2d processing"""
 
-    @pytest.fixture()
-    def left_image(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def left_image(self, tmp_path_factory):
         """
         Create a fake image to test roi configuration
         """
-        image_path = tmp_path / "left_img.png"
+        # An uncompressed tiff is cheaper to encode than a png and is written only once for the class
+        image_path = tmp_path_factory.mktemp("data") / "left_img.tif"
         data = np.array(
             ([[1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 4, 5, 6, 7], [1, 1, 1, 1, 1]]),
             dtype=np.uint8,
         )
-        imsave(image_path, data)
+        tifffile.imwrite(image_path, data)
 
         return image_path
 
-    @pytest.fixture()
-    def right_image(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def right_image(self, tmp_path_factory):
         """
         Create a fake image to test roi configuration
         """
-        image_path = tmp_path / "right_img.png"
+        # An uncompressed tiff is cheaper to encode than a png and is written only once for the class
+        image_path = tmp_path_factory.mktemp("data") / "right_img.tif"
         data = np.array(
             ([[1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 4, 5, 6, 7], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1]]),
             dtype=np.uint8,
         )
-        imsave(image_path, data)
+        tifffile.imwrite(image_path, data)
 
         return image_path
 
@@ -843,8 +845,8 @@ class TestMatchingCostWithRoi:
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=img_left,
             img_right=img_right,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
             cfg=cfg,
         )
 
@@ -852,10 +854,10 @@ class TestMatchingCostWithRoi:
         zncc = matching_cost_matcher.compute_cost_volumes(
             img_left=img_left,
             img_right=img_right,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
 
         # crop image with roi
@@ -865,18 +867,18 @@ class TestMatchingCostWithRoi:
         matching_cost_matcher.allocate_cost_volume_pandora(
             img_left=img_left,
             img_right=img_right,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
             cfg=cfg,
         )
         # compute cost volumes with roi
         zncc_roi = matching_cost_matcher.compute_cost_volumes(
             img_left=img_left,
             img_right=img_right,
-            grid_min_col=np.full((3, 3), 0),
-            grid_max_col=np.full((3, 3), 1),
-            grid_min_row=np.full((3, 3), -1),
-            grid_max_row=np.full((3, 3), 0),
+            grid_min_col=np.broadcast_to(0, (3, 3)),
+            grid_max_col=np.broadcast_to(1, (3, 3)),
+            grid_min_row=np.broadcast_to(-1, (3, 3)),
+            grid_max_row=np.broadcast_to(0, (3, 3)),
         )
 
         assert zncc["cost_volumes"].data.shape == (5, 5, 2, 2)
@@ -23,7 +23,6 @@
 """
 Test state_machine
 """
-import copy
 import numpy as np
 
 import pytest
@@ -33,7 +32,6 @@ from transitions.core import MachineError
 
 from pandora.margins import Margins
 from tests import common
-from pandora2d import state_machine
 from pandora2d.img_tools import create_datasets_from_inputs
 
 
@@ -43,29 +41,25 @@ class TestPandora2D:
     """
 
     @staticmethod
-    def test_run_pandora() -> None:
+    def test_run_pandora(pandora2d_machine) -> None:
         """
         Test function for checking user input section
         """
 
-        pandora2d_machine = state_machine.Pandora2DMachine()
-
-        correct_cfg = copy.deepcopy(common.correct_pipeline)
+        correct_cfg = common.clone_cfg(common.correct_pipeline)
         pandora2d_machine.check_conf(correct_cfg)
 
-        false_cfg_mc = copy.deepcopy(common.false_pipeline_mc)
-        false_cfg_disp = copy.deepcopy(common.false_pipeline_disp)
+        false_cfg_mc = common.clone_cfg(common.false_pipeline_mc)
+        false_cfg_disp = common.clone_cfg(common.false_pipeline_disp)
         with pytest.raises(MachineError):
             pandora2d_machine.check_conf(false_cfg_mc)
             pandora2d_machine.check_conf(false_cfg_disp)
 
     @staticmethod
-    def test_run_prepare() -> None:
+    def test_run_prepare(pandora2d_machine) -> None:
         """
         Test run_prepare function
         """
-        pandora2d_machine = state_machine.Pandora2DMachine()
-
         input_config = {
             "left": {"img": "./tests/data/left.png", "nodata": -9999},
             "right": {"img": "./tests/data/right.png", "nodata": -9999},
@@ -76,30 +70,24 @@ class TestPandora2D:
 
         pandora2d_machine.run_prepare(img_left, img_right)
 
+        # Expected disparity grids are built once and shared between the row/col assertions
+        expected_disp_min = np.full((img_left.sizes["row"], img_left.sizes["col"]), -2)
+        expected_disp_max = np.full((img_left.sizes["row"], img_left.sizes["col"]), 2)
+
         assert pandora2d_machine.left_img == img_left
         assert pandora2d_machine.right_img == img_right
-        np.testing.assert_array_equal(
-            pandora2d_machine.disp_min_col, np.full((img_left.sizes["row"], img_left.sizes["col"]), -2)
-        )
-        np.testing.assert_array_equal(
-            pandora2d_machine.disp_max_col, np.full((img_left.sizes["row"], img_left.sizes["col"]), 2)
-        )
-        np.testing.assert_array_equal(
-            pandora2d_machine.disp_min_row, np.full((img_left.sizes["row"], img_left.sizes["col"]), -2)
-        )
-        np.testing.assert_array_equal(
-            pandora2d_machine.disp_max_row, np.full((img_left.sizes["row"], img_left.sizes["col"]), 2)
-        )
+        np.testing.assert_array_equal(pandora2d_machine.disp_min_col, expected_disp_min)
+        np.testing.assert_array_equal(pandora2d_machine.disp_max_col, expected_disp_max)
+        np.testing.assert_array_equal(pandora2d_machine.disp_min_row, expected_disp_min)
+        np.testing.assert_array_equal(pandora2d_machine.disp_max_row, expected_disp_max)
 
     @staticmethod
-    def test_global_margins() -> None:
+    def test_global_margins(pandora2d_machine) -> None:
         """
         Test computed global margins is as expected.
         """
 
-        pandora2d_machine = state_machine.Pandora2DMachine()
-
-        pipeline_cfg = copy.deepcopy(common.correct_pipeline)
+        pipeline_cfg = common.clone_cfg(common.correct_pipeline)
         pandora2d_machine.check_conf(pipeline_cfg)
 
         assert pandora2d_machine.margins.global_margins == Margins(3, 3, 3, 3)